@@ -0,0 +1,174 @@
+import asyncio
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Union,
+)
+from xml import sax
+from xml.sax.expatreader import ExpatLocator, create_parser
+
+import commonmark
+
+from rfc_http_validate.markdown import MarkdownHttpExtractor
+from rfc_http_validate.validate import RfcHttpValidator, ValidatorUi
+from rfc_http_validate.xml import XmlHttpExtractor
+
+Source = Union[bytes, AsyncIterable[bytes]]
+
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+CHUNK_SIZE = 64 * 1024
+
+
+class ValidationResult(NamedTuple):
+    kind: str  # "status", "skip", "success", "error" or "fatal"
+    subject: str
+    message: str
+
+
+class CollectingUi(ValidatorUi):
+    """
+    A ValidatorUi that holds results until they're drained. Each document
+    gets its own, so validations never share mutable state.
+    """
+
+    def __init__(self) -> None:
+        self.results: List[ValidationResult] = []
+
+    def status(self, message: str) -> None:
+        self.results.append(ValidationResult("status", "", message))
+
+    def skip(self, subject: str, message: str) -> None:
+        self.results.append(ValidationResult("skip", subject, message))
+
+    def success(self, subject: str, message: str) -> None:
+        self.results.append(ValidationResult("success", subject, message))
+
+    def error(self, subject: str, message: str) -> None:
+        self.results.append(ValidationResult("error", subject, message))
+
+    def fatal_error(self, message: str) -> None:
+        self.results.append(ValidationResult("fatal", "", message))
+
+    def drain(self) -> List[ValidationResult]:
+        results, self.results = self.results, []
+        return results
+
+
+def freeze_field_types(field_types: Mapping[str, str]) -> Mapping[str, str]:
+    """
+    Return a read-only copy of field_types, suitable for sharing between
+    concurrent validations.
+    """
+    if isinstance(field_types, MappingProxyType):
+        return field_types
+    return MappingProxyType(dict(field_types))
+
+
+@lru_cache(maxsize=None)
+def get_default_executor() -> Executor:
+    return ThreadPoolExecutor(
+        max_workers=MAX_WORKERS, thread_name_prefix="rfc-http-validate"
+    )
+
+
+async def validate_document(
+    source: Source,
+    fmt: str,
+    field_types: Mapping[str, str],
+    filename: str = "<input>",
+    executor: Optional[Executor] = None,
+) -> AsyncIterator[ValidationResult]:
+    """
+    Validate the HTTP messages in a document, yielding results as they become
+    available.
+
+    source is either the document as bytes, or an async iterable of byte
+    chunks (e.g., an aiohttp or asyncio StreamReader). fmt is "xml" or "md".
+    Parsing happens on executor (by default, a small shared thread pool) so
+    that the event loop isn't blocked.
+
+    field_types is copied unless it has already been through
+    freeze_field_types(), so freeze it once to share it between documents.
+    """
+    if fmt not in ["xml", "md"]:
+        raise ValueError(f"Unknown document format '{fmt}'")
+    if executor is None:
+        executor = get_default_executor()
+    ui = CollectingUi()
+    validator = RfcHttpValidator(freeze_field_types(field_types), ui)
+    if fmt == "xml":
+        results = _validate_xml(source, filename, validator, ui, executor)
+    else:
+        results = _validate_md(source, filename, validator, ui, executor)
+    async for result in results:
+        yield result
+
+
+async def _iter_chunks(source: Source) -> AsyncIterator[bytes]:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = bytes(source)
+        for start in range(0, len(data), CHUNK_SIZE):
+            yield data[start : start + CHUNK_SIZE]
+        return
+    async for chunk in source:
+        yield chunk
+
+
+async def _validate_xml(
+    source: Source,
+    filename: str,
+    validator: RfcHttpValidator,
+    ui: CollectingUi,
+    executor: Executor,
+) -> AsyncIterator[ValidationResult]:
+    loop = asyncio.get_running_loop()
+    parser = create_parser()
+    handler = XmlHttpExtractor(validator, filename)
+    parser.setContentHandler(handler)
+    # parse() normally does this, but we're feeding the parser ourselves.
+    handler.setDocumentLocator(ExpatLocator(parser))
+    try:
+        async for chunk in _iter_chunks(source):
+            await loop.run_in_executor(executor, parser.feed, chunk)
+            for result in ui.drain():
+                yield result
+        await loop.run_in_executor(executor, parser.close)
+    except sax.SAXParseException as why:
+        # The parser has no system id when fed directly, so name the file here.
+        ui.fatal_error(
+            f"{filename}:{why.getLineNumber()}:{why.getColumnNumber()}: "
+            f"{why.getMessage()}"
+        )
+    for result in ui.drain():
+        yield result
+
+
+async def _validate_md(
+    source: Source,
+    filename: str,
+    validator: RfcHttpValidator,
+    ui: CollectingUi,
+    executor: Executor,
+) -> AsyncIterator[ValidationResult]:
+    loop = asyncio.get_running_loop()
+    # CommonMark needs the whole document to resolve block structure.
+    chunks = [chunk async for chunk in _iter_chunks(source)]
+
+    def parse() -> None:
+        doc = commonmark.Parser().parse(b"".join(chunks).decode("utf-8"))
+        MarkdownHttpExtractor(validator, filename).render(doc)
+
+    try:
+        await loop.run_in_executor(executor, parse)
+    except UnicodeDecodeError as why:
+        ui.fatal_error(f"Cannot decode {filename}: {why}")
+    for result in ui.drain():
+        yield result
@@ -0,0 +1,71 @@
+from html.parser import HTMLParser
+from os.path import basename
+from typing import IO, List, Optional, Tuple
+
+from rfc_http_validate.validate import RfcHttpValidator
+
+CHUNK_SIZE = 64 * 1024
+
+
+def extract_html(fh: IO[str], validator: RfcHttpValidator) -> None:
+    handler = HtmlHttpExtractor(validator, fh.name)
+    while True:
+        chunk = fh.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        handler.feed(chunk)
+    handler.close()
+
+
+class HtmlHttpExtractor(HTMLParser):
+    """
+    Find rfc-editor HTML source code blocks. Older xml2rfc releases put the
+    classes on the <pre> (<pre class="sourcecode lang-http-message">); newer
+    ones put them on a wrapping <div> and leave the <pre> bare.
+    """
+
+    def __init__(self, validator: RfcHttpValidator, filename: str) -> None:
+        HTMLParser.__init__(self)
+        self.validator = validator
+        self.filename = filename
+        self.listening = False
+        self.content = ""
+        self.type = ""
+        self.div_type = ""
+        self.start_line = 0
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag not in ["div", "pre"]:
+            return
+        classes = (dict(attrs).get("class") or "").split()
+        langs = [c[len("lang-") :] for c in classes if c.startswith("lang-")]
+        lang = langs[0] if "sourcecode" in classes and langs else ""
+        if tag == "div":
+            self.div_type = lang
+        elif lang or self.div_type:
+            self.listening = True
+            self.type = lang or self.div_type
+            self.start_line = self.getpos()[0]
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "div":
+            self.div_type = ""
+        if tag == "pre" and self.listening:
+            self.listening = False
+            if self.type in ["http-message"]:
+                self.validator.validate(self.content, self.location)
+            else:
+                self.validator.ui.skip(
+                    self.location(self.type), "section not a 'http-message'"
+                )
+            self.content = ""
+
+    def handle_data(self, data: str) -> None:
+        if self.listening:
+            self.content += data
+
+    def location(self, pinpoint: str = "") -> str:
+        out = f"{basename(self.filename)}:{self.start_line}"
+        if pinpoint:
+            out += f" '{pinpoint}'"
+        return out
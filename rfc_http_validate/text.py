@@ -0,0 +1,114 @@
+import re
+from os.path import basename
+from typing import IO, Iterable, Iterator, List, Tuple
+
+from rfc_http_validate.validate import RfcHttpValidator
+
+TEXT_INDENT = 3
+PAGE_FOOTER = re.compile(r"^\S.*\[Page \d+\]\s*$")
+PAGE_HEADER = re.compile(r"^(?:RFC \d+|Internet-Draft)\s")
+CAPTION = re.compile(r"^\s*Figure \d+(?::|\s*$)")
+START_LINE = re.compile(r"^(?:[A-Z][A-Z0-9_-]* \S+ HTTP/1\.\d|HTTP/1\.\d \d{3})\b")
+FIELD_LINE = re.compile(r"^[A-Za-z0-9!#$%&'*+.^_`|~-]+:")
+NOTE_8792 = "NOTE: '\\' line wrapping per RFC 8792"
+
+
+def extract_txt(fh: IO[str], validator: RfcHttpValidator) -> None:
+    handler = TxtHttpExtractor(validator, fh.name)
+    for lineno, line in strip_pages(fh):
+        handler.line(lineno, line)
+    handler.close()
+
+
+def strip_pages(lines: Iterable[str]) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (line number, line) for each line of an rfc-editor plaintext
+    document, leaving out page footers, form feeds, page headers and the
+    blank lines that pad them.
+    """
+    blanks: List[Tuple[int, str]] = []
+    in_page_break = False
+    for lineno, line in enumerate(lines, 1):
+        line = line.rstrip("\r\n")
+        if "\f" in line:
+            blanks = []
+            in_page_break = True
+            line = line.replace("\f", "")
+        if not line.strip():
+            if not in_page_break:
+                blanks.append((lineno, ""))
+            continue
+        if in_page_break and PAGE_HEADER.match(line):
+            continue  # still in the page break, so padding after it goes too
+        in_page_break = False
+        if PAGE_FOOTER.match(line):
+            blanks = []
+            continue
+        yield from blanks
+        blanks = []
+        yield lineno, line
+
+
+class TxtHttpExtractor:
+    """
+    Find indented figures in plaintext that look like HTTP messages; i.e.,
+    that start with a request or status line, or that consist only of field
+    lines (either optionally after an RFC 8792 wrapping note).
+    """
+
+    def __init__(self, validator: RfcHttpValidator, filename: str) -> None:
+        self.validator = validator
+        self.filename = filename
+        self.figure: List[str] = []
+        self.indent = 0
+        self.lineno = 0
+
+    def line(self, lineno: int, line: str) -> None:
+        if self.figure:
+            if not line.strip():
+                if FIELD_LINE.match(self.figure[0]):
+                    self.close()  # field lines alone don't have a body
+                else:
+                    self.figure.append("")
+                return
+            indent = len(line) - len(line.lstrip(" "))
+            content = line[self.indent :]
+            new_message = self.figure[-1] == "" and START_LINE.match(content)
+            if indent >= self.indent and not CAPTION.match(line) and not new_message:
+                self.figure.append(content)
+                return
+            self.close()
+        content = line.lstrip(" ")
+        indent = len(line) - len(content)
+        if indent > TEXT_INDENT and (
+            START_LINE.match(content)
+            or FIELD_LINE.match(content)
+            or content.startswith(NOTE_8792)
+        ):
+            self.figure = [content]
+            self.indent = indent
+            self.lineno = lineno
+
+    def close(self) -> None:
+        figure, self.figure = self.figure, []
+        while figure and not figure[-1]:
+            figure.pop()
+        if not figure:
+            return
+        if FIELD_LINE.match(figure[0]) and not all(
+            FIELD_LINE.match(line) or line.startswith(" ") for line in figure
+        ):
+            return  # e.g., an indented "Note: ..." paragraph
+        if figure[0].startswith(NOTE_8792):
+            # RFC 8792 puts a blank line between the note and the content.
+            if len(figure) < 3 or figure[1]:
+                return
+            if not (START_LINE.match(figure[2]) or FIELD_LINE.match(figure[2])):
+                return
+        self.validator.validate("\n".join(figure), self.location)
+
+    def location(self, pinpoint: str = "") -> str:
+        out = f"{basename(self.filename)}:{self.lineno}"
+        if pinpoint:
+            out += f" '{pinpoint}'"
+        return out
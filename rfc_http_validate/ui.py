@@ -1,12 +1,15 @@
 import argparse
 import json
+import os
 import sys
-from typing import Dict
+from typing import Dict, TextIO
 
 from blessings import Terminal  # type: ignore
 
-from rfc_http_validate.validate import RfcHttpValidator, ValidatorUi
+from rfc_http_validate.html import extract_html
 from rfc_http_validate.markdown import extract_md
+from rfc_http_validate.text import extract_txt
+from rfc_http_validate.validate import RfcHttpValidator, ValidatorUi
 from rfc_http_validate.xml import extract_xml
 
 term = Terminal()
@@ -17,41 +20,125 @@ class ValidatorCLI(ValidatorUi):
         self.args = self.parse_args()
         self.field_types = self.load_field_types()
         self.errors = 0
+        self.output: TextIO = sys.stdout
+        self.term = term
+        self.to_file = False
         self.run()
 
     def run(self) -> None:
         validator = RfcHttpValidator(self.field_types, self)
+        if self.args.output_dir:
+            self.check_result_names()
+            os.makedirs(self.args.output_dir, exist_ok=True)
         for path in self.args.file:
-            if path.endswith(".xml"):
-                with open(path, "rb") as xml_fh:
-                    extract_xml(xml_fh, validator)
-            elif path.endswith(".md"):
-                with open(path, "r", encoding="utf-8") as md_fh:
-                    extract_md(md_fh, validator)
+            if self.args.output_dir:
+                self.extract_to_file(path, validator)
             else:
-                self.fatal_error(f"Can't determine format of {path}")
+                self.extract(path, validator)
         if self.errors > 0:
             sys.exit(1)
 
+    def extract(self, path: str, validator: RfcHttpValidator) -> None:
+        if path.endswith(".xml"):
+            with open(path, "rb") as xml_fh:
+                extract_xml(xml_fh, validator)
+        elif path.endswith(".md"):
+            with open(path, "r", encoding="utf-8", errors="replace") as md_fh:
+                extract_md(md_fh, validator)
+        elif path.endswith(".txt"):
+            with open(path, "r", encoding="utf-8", errors="replace") as txt_fh:
+                extract_txt(txt_fh, validator)
+        elif path.endswith(".html"):
+            with open(path, "r", encoding="utf-8", errors="replace") as html_fh:
+                extract_html(html_fh, validator)
+        else:
+            self.fatal_error(f"Can't determine format of {path}")
+
+    def extract_to_file(self, path: str, validator: RfcHttpValidator) -> None:
+        result_path = os.path.join(
+            self.args.output_dir, f"{os.path.basename(path)}.results"
+        )
+        if os.path.exists(result_path):
+            errors = self.count_errors(result_path)
+            self.errors += errors
+            self.status(f"{path}: skipping; {errors} errors in {result_path}")
+            return
+        # Write to a temporary file so that an interrupted run isn't resumed
+        # with partial results.
+        tmp_path = f"{result_path}.tmp"
+        errors = self.errors
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as result_fh:
+                self.output, self.term = result_fh, Terminal(stream=result_fh)
+                self.to_file = True
+                try:
+                    self.extract(path, validator)
+                except OSError as why:
+                    self.fatal_error(f"Cannot read {path}: {why}")
+                except Exception as why:  # pylint: disable=broad-exception-caught
+                    # Don't let one odd file stop a run over many.
+                    self.fatal_error(f"Cannot process {path}: {why!r}")
+                finally:
+                    self.output, self.term = sys.stdout, term
+                    self.to_file = False
+                result_fh.write(f"{self.errors - errors} errors\n")
+            os.replace(tmp_path, result_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self.status(f"{path}: {self.errors - errors} errors")
+
+    def check_result_names(self) -> None:
+        # Results files are named after the input's basename, so two inputs
+        # with the same name would share (and skip) one results file.
+        seen: Dict[str, str] = {}
+        for path in self.args.file:
+            name = os.path.basename(path)
+            if name in seen and seen[name] != path:
+                self.fatal_error(
+                    f"{seen[name]} and {path} would share a results file; "
+                    "validate them in separate runs or output directories"
+                )
+            seen[name] = path
+
+    @staticmethod
+    def count_errors(result_path: str) -> int:
+        last_line = ""
+        with open(result_path, "r", encoding="utf-8") as result_fh:
+            for line in result_fh:
+                last_line = line
+        try:
+            return int(last_line.split()[0])
+        except (IndexError, ValueError):
+            return 0
+
     def status(self, message: str) -> None:
         if not self.args.quiet:
             print(message)
 
     def success(self, subject: str, message: str) -> None:
         if not self.args.quiet:
-            print(f"{subject} -- {term.green}{message}{term.normal}")
+            print(
+                f"{subject} -- {self.term.green}{message}{self.term.normal}",
+                file=self.output,
+            )
 
     def error(self, subject: str, message: str) -> None:
         self.errors += 1
-        print(f"{subject}: {term.red}{message}{term.normal}")
+        print(
+            f"{subject}: {self.term.red}{message}{self.term.normal}", file=self.output
+        )
 
     def skip(self, subject: str, message: str) -> None:
         if not self.args.quiet:
-            print(f"{subject}: {term.yellow}{message}{term.normal}")
+            print(
+                f"{subject}: {self.term.yellow}{message}{self.term.normal}",
+                file=self.output,
+            )
 
     def parse_args(self) -> argparse.Namespace:
         parser = argparse.ArgumentParser(
-            description="Validate HTTP messages in XML2RFC documents"
+            description="Validate HTTP messages in XML2RFC documents and RFCs"
         )
         parser.add_argument(
             "-m",
@@ -90,10 +177,17 @@ class ValidatorCLI(ValidatorUi):
             action="store_true",
             help="only output errors",
         )
+        parser.add_argument(
+            "-o",
+            "--output-dir",
+            dest="output_dir",
+            help="write each file's results to a file in this directory, "
+            "skipping files whose results are already there",
+        )
         parser.add_argument(
             "file",
             nargs="+",
-            help="an XML file to validate",
+            help="an XML, Markdown, plaintext or HTML file to validate",
         )
         return parser.parse_args()
 
@@ -116,5 +210,10 @@ class ValidatorCLI(ValidatorUi):
         return field_types
 
     def fatal_error(self, message: str) -> None:
+        if self.to_file:
+            # Record it against this file and carry on with the next one.
+            self.errors += 1
+            print(f"FATAL ERROR: {message}", file=self.output)
+            return
         sys.stderr.write(f"{term.red}FATAL ERROR:{term.normal} {message}\n")
         sys.exit(1)
@@ -1,4 +1,4 @@
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Mapping
 
 import http_sf
 
@@ -23,41 +23,40 @@ class ValidatorUi:
 
 
 class RfcHttpValidator:
-    def __init__(self, field_types: Dict[str, str], ui: ValidatorUi):
+    def __init__(self, field_types: Mapping[str, str], ui: ValidatorUi):
         self.field_types = field_types
         self.ui = ui
-        self.location: Callable[..., str]
 
     def validate(self, http_message: str, location: Callable[..., str]) -> None:
-        self.location = location
         message = http_message.strip("\n")
         if not message.strip():
-            self.ui.error(self.location(), "Empty http-message")
+            self.ui.error(location(), "Empty http-message")
             return
         lines = message.split("\n")
         lines = self.combine_8792(lines)
-        skip_lines = self.check_start_line(lines[0])
+        if not lines or not lines[0]:
+            self.ui.error(location(), "No message after RFC 8792 note")
+            return
+        skip_lines = self.check_start_line(lines[0], location)
         try:
-            headers = self.combine_headers(lines[skip_lines:])
+            headers = self.combine_headers(lines[skip_lines:], location)
         except ValueError as why:
-            self.ui.error(self.location(), str(why))
+            self.ui.error(location(), str(why))
             return
         for hname, hvalue in headers.items():
             header_type = self.field_types.get(hname)
             subject = f"{hname}: {hvalue}"
             try:
                 http_sf.parse(hvalue.encode("ascii"), tltype=header_type, name=hname)
-                self.ui.success(self.location(subject), "valid")
+                self.ui.success(location(subject), "valid")
             except ValueError as why:
-                self.ui.error(self.location(subject), str(why))
+                self.ui.error(location(subject), str(why))
             except KeyError:
-                self.ui.skip(self.location(hname), "no type information")
+                self.ui.skip(location(hname), "no type information")
 
-    def check_start_line(self, start_line: str) -> int:
+    def check_start_line(self, start_line: str, location: Callable[..., str]) -> int:
         if start_line[0].isspace():
-            self.ui.error(
-                self.location(start_line), "Start line starts with whitespace"
-            )
+            self.ui.error(location(start_line), "Start line starts with whitespace")
             return 0
         parts = start_line.split(" ")
         if parts[0][-1] == ":":
@@ -65,36 +64,34 @@ class RfcHttpValidator:
         if "http" in parts[0].lower():
             if parts[0] != "HTTP/1.1":
                 self.ui.error(
-                    self.location(start_line),
+                    location(start_line),
                     "Status line doesn't start with 'HTTP/1.1'",
                 )
             elif len(parts) < 3:
                 self.ui.error(
-                    self.location(),
+                    location(),
                     f"Status line '{start_line}' isn't 'HTTP/1.1 [status_code] [status_phrase]'",
                 )
             else:
                 if not parts[1].isdigit():
-                    self.ui.error(self.location(parts[1]), "Non-numeric status code")
+                    self.ui.error(location(parts[1]), "Non-numeric status code")
                 elif not 99 < int(parts[1]) < 600:
-                    self.ui.error(self.location(parts[1]), "Status code out of range")
+                    self.ui.error(location(parts[1]), "Status code out of range")
         else:
             if len(parts) < 3:
                 self.ui.error(
-                    self.location(), "Request line isn't '[method] [url] HTTP/1.1'"
+                    location(), "Request line isn't '[method] [url] HTTP/1.1'"
                 )
             else:
                 if parts[0] not in REGISTERED_METHODS:
-                    self.ui.error(self.location(parts[0]), "Method not recognised")
+                    self.ui.error(location(parts[0]), "Method not recognised")
                 if parts[2] != "HTTP/1.1":
                     self.ui.error(
-                        self.location(),
+                        location(),
                         f"Request line '{start_line}' doesn't end with 'HTTP/1.1'",
                     )
                 if len(parts) > 3:
-                    self.ui.error(
-                        self.location(start_line), "Request line has extra text"
-                    )
+                    self.ui.error(location(start_line), "Request line has extra text")
         return 1
 
     def combine_8792(self, lines: List[str]) -> List[str]:
@@ -116,7 +113,9 @@ class RfcHttpValidator:
                 output.append(line)
         return output
 
-    def combine_headers(self, lines: List[str]) -> Dict[str, str]:
+    def combine_headers(
+        self, lines: List[str], location: Callable[..., str]
+    ) -> Dict[str, str]:
         headers = {}  # type: Dict[str, str]
         prev_name: str = ""
         in_body = False
@@ -139,7 +138,7 @@ class RfcHttpValidator:
             except ValueError as why:
                 raise ValueError(f"Non-field line '{line}' in content") from why
             if " " in name:
-                self.ui.error(self.location(name), "Whitespace in field name")
+                self.ui.error(location(name), "Whitespace in field name")
             name = name.lower()
             value = value.strip()
             if name in headers:
@@ -0,0 +1,98 @@
+"""Tests for the asyncio validation API."""
+
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional, Union
+
+import pytest
+
+from rfc_http_validate.aio import ValidationResult, freeze_field_types, validate_document
+
+
+async def _chunked(data: bytes, size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+def _run(
+    source: Union[bytes, AsyncIterator[bytes]],
+    fmt: str,
+    field_types: Optional[Dict[str, str]] = None,
+) -> List[ValidationResult]:
+    async def collect() -> List[ValidationResult]:
+        return [
+            result async for result in validate_document(source, fmt, field_types or {})
+        ]
+
+    return asyncio.run(collect())
+
+
+def _kinds(results: List[ValidationResult]) -> List[str]:
+    return [result.kind for result in results]
+
+
+def test_xml_bytes() -> None:
+    body = b'<doc><sourcecode type="http-message">\nFoo: 1\n</sourcecode></doc>'
+    results = _run(body, "xml", {"foo": "item"})
+    assert _kinds(results) == ["success"]
+
+
+def test_xml_streamed_in_small_chunks() -> None:
+    body = (
+        b"<doc>"
+        b'<sourcecode type="http-message">\nFoo: 1\n</sourcecode>'
+        b'<artwork type="http-message">\nFoo: :::\n</artwork>'
+        b"</doc>"
+    )
+    results = _run(_chunked(body, 7), "xml", {"foo": "list"})
+    assert _kinds(results) == ["success", "error"]
+
+
+def test_xml_malformed_is_fatal() -> None:
+    body = b'<doc><sourcecode type="http-message">\nFoo: 1\n'
+    results = _run(_chunked(body, 10), "xml")
+    assert _kinds(results)[-1] == "fatal"
+    assert results[-1].message.startswith("<input>:3:")
+
+    async def collect() -> List[ValidationResult]:
+        return [r async for r in validate_document(b"<doc><x>", "xml", {}, filename="draft.xml")]
+
+    assert asyncio.run(collect())[-1].message == "draft.xml:1:8: no element found"
+
+
+def test_md_streamed() -> None:
+    body = "# Title\n\n```http-message\nFoo: 1\n```\n".encode("utf-8")
+    results = _run(_chunked(body, 5), "md", {"foo": "item"})
+    assert _kinds(results) == ["success"]
+
+
+def test_unknown_format() -> None:
+    with pytest.raises(ValueError):
+        _run(b"", "docx")
+
+
+def test_concurrent_documents_share_field_types() -> None:
+    field_types = {"foo": "item"}
+    good = b'<doc><sourcecode type="http-message">\nFoo: 1\n</sourcecode></doc>'
+    bad = b'<doc><sourcecode type="http-message">\nFoo: :::\n</sourcecode></doc>'
+
+    async def collect(source: bytes, name: str) -> List[ValidationResult]:
+        return [
+            result
+            async for result in validate_document(
+                _chunked(source, 3), "xml", field_types, filename=name
+            )
+        ]
+
+    async def main() -> List[List[ValidationResult]]:
+        return await asyncio.gather(
+            *[collect(good if i % 2 else bad, f"doc{i}.xml") for i in range(20)]
+        )
+
+    for i, results in enumerate(asyncio.run(main())):
+        assert _kinds(results) == (["success"] if i % 2 else ["error"])
+        assert all(r.subject.startswith(f"doc{i}.xml:") for r in results)
+
+
+def test_frozen_field_types_are_not_copied() -> None:
+    field_types = freeze_field_types({"foo": "item"})
+    assert freeze_field_types(field_types) is field_types
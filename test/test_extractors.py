@@ -1,9 +1,15 @@
-"""Integration tests for the Markdown and XML extractors."""
+"""Integration tests for the Markdown, XML, plaintext and HTML extractors."""
 
+import sys
 from pathlib import Path
 from typing import Dict, Optional
 
+import pytest
+
+from rfc_http_validate.html import extract_html
 from rfc_http_validate.markdown import extract_md
+from rfc_http_validate.text import extract_txt
+from rfc_http_validate.ui import ValidatorCLI
 from rfc_http_validate.validate import RfcHttpValidator
 from rfc_http_validate.xml import extract_xml
 
@@ -20,6 +26,26 @@ def _md(tmp_path: Path, body: str, field_types: Optional[Dict[str, str]] = None)
     return ui
 
 
+def _txt(tmp_path: Path, body: str, field_types: Optional[Dict[str, str]] = None) -> RecordingUi:
+    path = tmp_path / "rfc9999.txt"
+    path.write_text(body, encoding="utf-8")
+    ui = RecordingUi()
+    validator = RfcHttpValidator(field_types or {}, ui)
+    with path.open("r", encoding="utf-8") as fh:
+        extract_txt(fh, validator)
+    return ui
+
+
+def _html(tmp_path: Path, body: str, field_types: Optional[Dict[str, str]] = None) -> RecordingUi:
+    path = tmp_path / "rfc9999.html"
+    path.write_text(body, encoding="utf-8")
+    ui = RecordingUi()
+    validator = RfcHttpValidator(field_types or {}, ui)
+    with path.open("r", encoding="utf-8") as fh:
+        extract_html(fh, validator)
+    return ui
+
+
 def _xml(tmp_path: Path, body: str, field_types: Optional[Dict[str, str]] = None) -> RecordingUi:
     path = tmp_path / "draft.xml"
     path.write_text(body, encoding="utf-8")
@@ -78,3 +104,261 @@ def test_xml_malformed_is_fatal(tmp_path: Path) -> None:
     body = '<doc><sourcecode type="http-message">\nFoo: 1\n'  # unclosed
     ui = _xml(tmp_path, body)
     assert "fatal" in ui.kinds()
+
+
+# -- plaintext -------------------------------------------------------------
+
+
+def test_txt_validates_indented_message(tmp_path: Path) -> None:
+    body = (
+        "   For example:\n"
+        "\n"
+        "     GET / HTTP/1.1\n"
+        "     Foo: 1\n"
+        "\n"
+        "   More text.\n"
+    )
+    ui = _txt(tmp_path, body, {"foo": "item"})
+    assert ui.messages("success") == ["valid"]
+    assert "error" not in ui.kinds()
+
+
+def test_txt_ignores_prose_and_other_figures(tmp_path: Path) -> None:
+    body = (
+        "   A request is sent with GET / HTTP/1.1 as its request line.\n"
+        "\n"
+        "     {\"foo\": 1}\n"
+    )
+    ui = _txt(tmp_path, body)
+    assert ui.events == []
+
+
+def test_txt_strips_page_breaks_inside_figure(tmp_path: Path) -> None:
+    body = (
+        "     HTTP/1.1 200 OK\n"
+        "     Foo: 1\n"
+        "\n"
+        "\n"
+        "Nottingham                   Standards Track                   [Page 3]\n"
+        "\f\n"
+        "RFC 9999                      Example                      October 2026\n"
+        "\n"
+        "\n"
+        "     Bar: 2\n"
+        "\n"
+        "   Text.\n"
+    )
+    ui = _txt(tmp_path, body, {"foo": "item", "bar": "item"})
+    assert ui.messages("success") == ["valid", "valid"]
+    assert "error" not in ui.kinds()
+
+
+def test_txt_consecutive_messages(tmp_path: Path) -> None:
+    body = (
+        "     GET / HTTP/1.1\n"
+        "     Foo: 1\n"
+        "\n"
+        "     HTTP/1.1 200 OK\n"
+        "     Foo: :::\n"
+    )
+    ui = _txt(tmp_path, body, {"foo": "list"})
+    assert ui.kinds() == ["success", "error"]
+    assert ui.events[1][1].startswith("rfc9999.txt:4 ")
+
+
+def test_txt_validates_field_only_figures(tmp_path: Path) -> None:
+    body = (
+        "   For example:\n"
+        "\n"
+        "     Example-List: sugar, tea, rum\n"
+        "\n"
+        "     Example-Dict: a=1,\n"
+        "                   b=:::\n"
+        "\n"
+        "   More text.\n"
+    )
+    ui = _txt(tmp_path, body, {"example-list": "list", "example-dict": "dictionary"})
+    assert ui.messages("success") == ["valid"]
+    assert [subject.split(" ")[0] for kind, subject, _ in ui.events if kind == "error"] == [
+        "rfc9999.txt:5"
+    ]
+
+
+def test_txt_ignores_indented_prose_with_colon(tmp_path: Path) -> None:
+    body = (
+        "      Note: this paragraph is indented because it is\n"
+        "      part of a list item.\n"
+    )
+    ui = _txt(tmp_path, body)
+    assert ui.events == []
+
+
+def test_txt_rfc8792_note_needs_blank_line(tmp_path: Path) -> None:
+    body = (
+        "     NOTE: '\\' line wrapping per RFC 8792\n"
+        "     GET / HTTP/1.1\n"
+        "     Foo: 1\n"
+    )
+    ui = _txt(tmp_path, body, {"foo": "item"})
+    assert ui.events == []
+
+
+def test_txt_figure_ends_at_caption(tmp_path: Path) -> None:
+    body = (
+        "     GET / HTTP/1.1\n"
+        "     Foo: 1\n"
+        "\n"
+        "                          Figure 1: An Example\n"
+    )
+    ui = _txt(tmp_path, body, {"foo": "item"})
+    assert ui.kinds() == ["success"]
+
+
+# -- html ------------------------------------------------------------------
+
+
+def test_html_validates_sourcecode(tmp_path: Path) -> None:
+    body = (
+        "<html>\n"
+        "<body>\n"
+        "<p>For example:</p>\n"
+        '<div class="sourcecode"><pre class="sourcecode lang-http-message">\n'
+        "HTTP/1.1 200 OK\n"
+        "Foo: 1\n"
+        "Bar: :::\n"
+        "</pre></div>"
+    )
+    ui = _html(tmp_path, body, {"foo": "item", "bar": "list"})
+    assert ui.messages("success") == ["valid"]
+    assert [subject for kind, subject, _ in ui.events if kind == "error"] == [
+        "rfc9999.html:4 'bar: :::'"
+    ]
+
+
+def test_html_validates_sourcecode_div(tmp_path: Path) -> None:
+    body = (
+        "<p>For example:</p>\n"
+        '<div class="sourcecode lang-http-message" id="section-2-3">\n'
+        "<pre>\n"
+        "Foo: 1\n"
+        "Bar: :::\n"
+        '</pre><a href="#section-2-3" class="pilcrow">&para;</a>\n'
+        "</div>\n"
+        "<pre>Baz: :::</pre>\n"
+    )
+    ui = _html(tmp_path, body, {"foo": "item", "bar": "list", "baz": "list"})
+    assert ui.messages("success") == ["valid"]
+    assert [subject for kind, subject, _ in ui.events if kind == "error"] == [
+        "rfc9999.html:3 'bar: :::'"
+    ]
+
+
+def test_html_skips_other_types_in_div(tmp_path: Path) -> None:
+    body = '<div class="sourcecode lang-json"><pre>{"a": 1}</pre></div>'
+    ui = _html(tmp_path, body)
+    assert ui.kinds() == ["skip"]
+
+
+def test_html_unescapes_content(tmp_path: Path) -> None:
+    body = '<pre class="sourcecode lang-http-message">Foo: &quot;a&quot;</pre>'
+    ui = _html(tmp_path, body, {"foo": "item"})
+    assert ui.messages("success") == ["valid"]
+
+
+def test_html_skips_other_types(tmp_path: Path) -> None:
+    body = '<pre class="sourcecode lang-json">{"a": 1}</pre><pre>Foo: 1</pre>'
+    ui = _html(tmp_path, body)
+    assert ui.kinds() == ["skip"]
+    assert "not a 'http-message'" in ui.messages("skip")[0]
+
+
+# -- command line ----------------------------------------------------------
+
+
+def test_cli_output_dir_resumes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    rfc = tmp_path / "rfc9999.html"
+    rfc.write_text('<pre class="sourcecode lang-http-message">Foo: 1</pre>', encoding="utf-8")
+    out = tmp_path / "out"
+    argv = ["rfc-http-validate", "-q", "-i", "Foo", "-o", str(out), str(rfc)]
+    monkeypatch.setattr(sys, "argv", argv)
+    ValidatorCLI()
+    result = out / "rfc9999.html.results"
+    assert result.read_text(encoding="utf-8") == "0 errors\n"
+
+    result.write_text("previous\n0 errors\n", encoding="utf-8")
+    ValidatorCLI()
+    assert result.read_text(encoding="utf-8") == "previous\n0 errors\n"
+
+
+def test_cli_output_dir_continues_past_bad_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    good = '<pre class="sourcecode lang-http-message">Foo: 1</pre>'
+    (tmp_path / "rfc1.html").write_text(good, encoding="utf-8")
+    (tmp_path / "rfc2.xml").write_text("<doc><unclosed>", encoding="utf-8")
+    (tmp_path / "rfc3.txt").write_bytes(b"\xff\xfe     GET / HTTP/1.1\n     Foo: 1\n")
+    (tmp_path / "rfc4.html").write_text(good, encoding="utf-8")
+    out = tmp_path / "out"
+    paths = [str(tmp_path / name) for name in ["rfc1.html", "rfc2.xml", "rfc3.txt", "rfc4.html"]]
+    monkeypatch.setattr(sys, "argv", ["rfc-http-validate", "-q", "-i", "Foo", "-o", str(out)] + paths)
+    with pytest.raises(SystemExit) as exit_info:
+        ValidatorCLI()
+    assert exit_info.value.code == 1
+    assert sorted(p.name for p in out.iterdir()) == [
+        "rfc1.html.results",
+        "rfc2.xml.results",
+        "rfc3.txt.results",
+        "rfc4.html.results",
+    ]
+    bad = (out / "rfc2.xml.results").read_text(encoding="utf-8")
+    assert bad.startswith("FATAL ERROR:")
+    assert bad.endswith("1 errors\n")
+    assert (out / "rfc3.txt.results").read_text(encoding="utf-8") == "0 errors\n"
+
+    # A resumed run still reports the earlier errors.
+    with pytest.raises(SystemExit) as exit_info:
+        ValidatorCLI()
+    assert exit_info.value.code == 1
+
+
+def test_cli_output_dir_records_unexpected_errors(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "draft.md").write_bytes(b"\xff\xfe\n```http-message\nFoo: 1\n```\n")
+    (tmp_path / "rfc1.txt").write_text("text", encoding="utf-8")
+    (tmp_path / "rfc2.html").write_text(
+        '<pre class="sourcecode lang-http-message">Foo: 1</pre>', encoding="utf-8"
+    )
+    out = tmp_path / "out"
+    paths = [str(tmp_path / name) for name in ["draft.md", "rfc1.txt", "rfc2.html"]]
+    argv = ["rfc-http-validate", "-q", "-i", "Foo", "-o", str(out)] + paths
+    monkeypatch.setattr(sys, "argv", argv)
+
+    def explode(*args: object) -> None:
+        raise IndexError("list index out of range")
+
+    monkeypatch.setattr("rfc_http_validate.ui.extract_txt", explode)
+    with pytest.raises(SystemExit) as exit_info:
+        ValidatorCLI()
+    assert exit_info.value.code == 1
+    assert (out / "draft.md.results").read_text(encoding="utf-8") == "0 errors\n"
+    txt = (out / "rfc1.txt.results").read_text(encoding="utf-8")
+    assert txt.startswith("FATAL ERROR: Cannot process")
+    assert "IndexError" in txt
+    assert (out / "rfc2.html.results").read_text(encoding="utf-8") == "0 errors\n"
+    assert not list(out.glob("*.tmp"))
+
+
+def test_cli_output_dir_refuses_duplicate_names(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for directory in ["a", "b"]:
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / "rfc2.html").write_text("", encoding="utf-8")
+    out = tmp_path / "out"
+    paths = [str(tmp_path / "a" / "rfc2.html"), str(tmp_path / "b" / "rfc2.html")]
+    monkeypatch.setattr(sys, "argv", ["rfc-http-validate", "-q", "-o", str(out)] + paths)
+    with pytest.raises(SystemExit) as exit_info:
+        ValidatorCLI()
+    assert exit_info.value.code == 1
+    assert not out.exists()
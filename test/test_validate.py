@@ -166,3 +166,8 @@ def test_rfc8792_unwrapping() -> None:
     # The three physical lines unwrap to a single token "aaaabbbbcccc".
     assert ui.messages("success") == ["valid"]
     assert "error" not in ui.kinds()
+
+
+def test_rfc8792_note_without_blank_line() -> None:
+    ui = run("# NOTE: '\\' line wrapping per RFC 8792\nGET / HTTP/1.1")
+    assert ui.messages("error") == ["No message after RFC 8792 note"]